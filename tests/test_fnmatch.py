@@ -363,7 +363,7 @@ class TestFnMatchTranslate(unittest.TestCase):
     def test_split_parsing(self):
         """Test wildcard parsing."""
 
-        _wcparse._compile.cache_clear()
+        _wcparse._clear_caches()
 
         flags = self.flags | fnmatch.FORCEUNIX
 
@@ -415,7 +415,9 @@ class TestFnMatchTranslate(unittest.TestCase):
 
         flags = self.flags | fnmatch.U
 
-        _wcparse._compile.cache_clear()
+        # Case sensitivity is cached, so clear it both ways to keep the mock from leaking in or out.
+        _wcparse._clear_caches()
+        self.addCleanup(_wcparse._clear_caches)
 
         p1, p2 = fnmatch.translate(
             r'test\x70\u0070\U00000070\160\N{LATIN SMALL LETTER P}', flags=flags | fnmatch.R
@@ -772,3 +774,12 @@ class TestTypes(unittest.TestCase):
         """Test `list` matching."""
 
         self.assertTrue(fnmatch.fnmatch('a', ['a']))
+
+    def test_match_mixed_types(self):
+        """Test that matching `bytes` against a `str` pattern, or the reverse, raises the same error with any flags."""
+
+        for flags in (0, fnmatch.I):
+            with self.assertRaisesRegex(TypeError, 'cannot use a string pattern on a bytes-like object'):
+                fnmatch.fnmatch(b'A.TXT', '*.txt', flags=flags)
+            with self.assertRaisesRegex(TypeError, 'cannot use a bytes pattern on a string-like object'):
+                fnmatch.fnmatch('A.TXT', b'*.txt', flags=flags)
@@ -1065,6 +1065,20 @@ class TestPathlibNorm(unittest.TestCase):
         self.assertEqual(glob.Glob('.')._pathlib_norm('.\\test'), 'test')
 
 
+class TestLiteralMatcher(unittest.TestCase):
+    """Test literal name matchers."""
+
+    def test_literal_matcher(self):
+        """Test that literal matchers return a `bool`, even for mismatched string types."""
+
+        for flags in (glob.CASE, glob.IGNORECASE):
+            matcher = glob.Glob('.', flags=flags)._get_matcher('Test')
+            self.assertIs(matcher('Test'), True)
+            self.assertIs(matcher('test'), flags == glob.IGNORECASE)
+            self.assertIs(matcher('other'), False)
+            self.assertIs(matcher(b'Test'), False)
+
+
 class TestHidden(_TestGlob):
     """Test hidden specific cases."""
 
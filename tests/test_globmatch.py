@@ -840,7 +840,7 @@ class TestGlobFilter:
     def test_glob_filter(self, case):
         """Test wildcard parsing."""
 
-        _wcparse._compile.cache_clear()
+        _wcparse._clear_caches()
 
         self._filter(case)
 
@@ -848,7 +848,7 @@ class TestGlobFilter:
     def test_glob_split_filter(self, case):
         """Test wildcard parsing by first splitting on `|`."""
 
-        _wcparse._compile.cache_clear()
+        _wcparse._clear_caches()
 
         self._filter(case, split=True)
 
@@ -1031,7 +1031,7 @@ class TestGlobMatchSpecial(unittest.TestCase):
         flags = self.flags
         flags |= glob.FORCEWIN
 
-        _wcparse._compile.cache_clear()
+        _wcparse._clear_caches()
 
         self.assertTrue(
             glob.globmatch(
@@ -2,9 +2,13 @@
 """Tests for `wcmatch`."""
 import unittest
 import os
+import sys
 import wcmatch.wcmatch as wcmatch
 import shutil
+import threading
+from unittest import mock
 from wcmatch import _wcparse
+from wcmatch import util
 
 
 # Below is general helper stuff that Python uses in `unittests`.  As these
@@ -56,10 +60,11 @@ def skip_unless_symlink(test):
 class _TestWcmatch(unittest.TestCase):
     """Test the `WcMatch` class."""
 
-    def mktemp(self, *parts):
+    @classmethod
+    def mktemp(cls, *parts):
         """Make temp directory."""
 
-        filename = self.norm(*parts)
+        filename = cls.norm(*parts)
         base, file = os.path.split(filename)
         if not os.path.exists(base):
             retry = 3
@@ -76,34 +81,36 @@ class _TestWcmatch(unittest.TestCase):
 
         raise TypeError
 
-    def norm(self, *parts):
+    @classmethod
+    def norm(cls, *parts):
         """Normalizes file path (in relation to temp directory)."""
-        tempdir = os.fsencode(self.tempdir) if isinstance(parts[0], bytes) else self.tempdir
-        return os.path.join(tempdir, *parts)
+
+        # Parts are always relative and without trailing slashes, so a plain join is enough.
+        if isinstance(parts[0], bytes):
+            return cls.sep_bytes.join((cls.tempdir_bytes, *parts))
+        return os.sep.join((cls.tempdir, *parts))
 
     def norm_list(self, files):
         """Normalize file list."""
 
         return sorted([self.norm(os.path.normpath(x)) for x in files])
 
-    def setUp(self):
-        """Setup."""
+    @classmethod
+    def setUpClass(cls):
+        """Setup the temp directory, which is shared by all tests in the class."""
 
-        self.tempdir = TESTFN + "_dir"
-        self.default_flags = wcmatch.R | wcmatch.I | wcmatch.M | wcmatch.SL
-        self.errors = []
-        self.skipped = 0
-        self.skip_records = []
-        self.error_records = []
-        self.files = []
+        cls.tempdir = TESTFN + "_dir"
+        cls.tempdir_bytes = os.fsencode(cls.tempdir)
+        cls.sep_bytes = os.fsencode(os.sep)
 
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Cleanup."""
 
         retry = 3
         while retry:
             try:
-                shutil.rmtree(self.tempdir)
+                shutil.rmtree(cls.tempdir)
                 retry = 0
             except Exception:  # noqa: PERF203
                 retry -= 1
@@ -124,17 +131,21 @@ class _TestWcmatch(unittest.TestCase):
 class TestWcmatch(_TestWcmatch):
     """Test the `WcMatch` class."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Setup the file tree shared by the tests (no test modifies it)."""
+
+        super().setUpClass()
+        cls.mktemp('.hidden', 'a.txt')
+        cls.mktemp('.hidden', 'b.file')
+        cls.mktemp('.hidden_file')
+        cls.mktemp('a.txt')
+        cls.mktemp('b.file')
+        cls.mktemp('c.txt.bak')
+
     def setUp(self):
         """Setup."""
 
-        self.tempdir = TESTFN + "_dir"
-        self.mktemp('.hidden', 'a.txt')
-        self.mktemp('.hidden', 'b.file')
-        self.mktemp('.hidden_file')
-        self.mktemp('a.txt')
-        self.mktemp('b.file')
-        self.mktemp('c.txt.bak')
-
         self.default_flags = wcmatch.R | wcmatch.I | wcmatch.M | wcmatch.SL
         self.errors = []
         self.skipped = 0
@@ -211,7 +222,7 @@ class TestWcmatch(_TestWcmatch):
         """Test non-recursive search."""
 
         walker = wcmatch.WcMatch(
-            os.fsencode(self.tempdir),
+            self.tempdir_bytes,
             b'*.txt',
             flags=self.default_flags | wcmatch.RECURSIVE
         )
@@ -233,11 +244,27 @@ class TestWcmatch(_TestWcmatch):
         self.assertEqual(self.skipped, 4)
         self.assertEqual(sorted(self.files), self.norm_list(['.hidden/a.txt', 'a.txt']))
 
+    def test_hidden_checked_on_accept(self):
+        """Test that only names that are accepted are checked for being hidden."""
+
+        walker = wcmatch.WcMatch(
+            self.tempdir,
+            '*.txt',
+            flags=self.default_flags | wcmatch.RECURSIVE
+        )
+
+        with mock.patch('wcmatch.util.is_hidden', wraps=util.is_hidden) as is_hidden:
+            self.crawl_files(walker)
+
+        # Only `a.txt` matches and only `.hidden` is a folder, everything else is skipped without a check.
+        self.assertEqual(is_hidden.call_count, 2)
+        self.assertEqual(sorted(self.files), self.norm_list(['a.txt']))
+
     def test_recursive_hidden_bytes(self):
         """Test non-recursive search with byte strings."""
 
         walker = wcmatch.WcMatch(
-            os.fsencode(self.tempdir),
+            self.tempdir_bytes,
             b'*.txt',
             flags=self.default_flags | wcmatch.RECURSIVE | wcmatch.HIDDEN
         )
@@ -246,6 +273,81 @@ class TestWcmatch(_TestWcmatch):
         self.assertEqual(self.skipped, 4)
         self.assertEqual(sorted(self.files), self.norm_list([b'.hidden/a.txt', b'a.txt']))
 
+    def test_recursive_threads(self):
+        """Test recursive search with directories read in a thread pool."""
+
+        walker = wcmatch.WcMatch(
+            self.tempdir,
+            '*.txt',
+            flags=self.default_flags | wcmatch.RECURSIVE | wcmatch.HIDDEN
+        )
+        expected = walker.match()
+
+        walker = wcmatch.WcMatch(
+            self.tempdir,
+            '*.txt',
+            flags=self.default_flags | wcmatch.RECURSIVE | wcmatch.HIDDEN,
+            threads=4
+        )
+
+        self.crawl_files(walker)
+        self.assertEqual(self.skipped, 4)
+        self.assertEqual(self.files, expected)
+        self.assertEqual(sorted(self.files), self.norm_list(['.hidden/a.txt', 'a.txt']))
+
+    def test_recursive_threads_fast_reads(self):
+        """Test that folders which read quickly are not read ahead in the thread pool."""
+
+        idents = set()
+        scandir = wcmatch.WcMatch._scandir
+
+        def record(walker, path):
+            idents.add(threading.get_ident())
+            return scandir(walker, path)
+
+        walker = wcmatch.WcMatch(
+            self.tempdir,
+            '*.txt',
+            flags=self.default_flags | wcmatch.RECURSIVE | wcmatch.HIDDEN,
+            threads=4
+        )
+
+        with mock.patch('wcmatch.wcmatch._SLOW_READ', float('inf')), \
+                mock.patch.object(wcmatch.WcMatch, '_scandir', record):
+            self.crawl_files(walker)
+        self.assertEqual(idents, {threading.get_ident()})
+        self.assertEqual(sorted(self.files), self.norm_list(['.hidden/a.txt', 'a.txt']))
+
+    def test_recursive_threads_slow_reads(self):
+        """Test that folders which read slowly are read ahead in the thread pool."""
+
+        walker = wcmatch.WcMatch(
+            self.tempdir,
+            '*.txt',
+            flags=self.default_flags | wcmatch.RECURSIVE | wcmatch.HIDDEN,
+            threads=4
+        )
+
+        with mock.patch('wcmatch.wcmatch._SLOW_READ', 0):
+            self.crawl_files(walker)
+        self.assertEqual(self.skipped, 4)
+        self.assertEqual(sorted(self.files), self.norm_list(['.hidden/a.txt', 'a.txt']))
+
+    def test_non_recursive_threads(self):
+        """Test that no thread pool is created when only one folder is searched."""
+
+        walker = wcmatch.WcMatch(
+            self.tempdir,
+            '*.txt',
+            flags=self.default_flags | wcmatch.HIDDEN,
+            threads=4
+        )
+
+        with mock.patch('wcmatch.wcmatch.ThreadPoolExecutor') as pool:
+            self.crawl_files(walker)
+        pool.assert_not_called()
+        self.assertEqual(sorted(self.files), self.norm_list(['a.txt']))
+
     def test_recursive_hidden_folder_exclude(self):
         """Test non-recursive search."""
 
@@ -259,6 +361,28 @@ class TestWcmatch(_TestWcmatch):
         self.assertEqual(self.skipped, 3)
         self.assertEqual(sorted(self.files), self.norm_list(['a.txt']))
 
+    def test_recursive_folder_exclude_not_scanned(self):
+        """Test that excluded folders are never read."""
+
+        walker = wcmatch.WcMatch(
+            self.tempdir,
+            '*.txt', exclude_pattern='.hidden',
+            flags=self.default_flags | wcmatch.RECURSIVE | wcmatch.HIDDEN
+        )
+
+        scanned = []
+        scandir = walker._scandir
+
+        def record(path):
+            scanned.append(path)
+            return scandir(path)
+
+        walker._scandir = record
+
+        self.crawl_files(walker)
+        self.assertEqual(sorted(self.files), self.norm_list(['a.txt']))
+        self.assertEqual(scanned, [walker._root_dir])
+
     def test_recursive_hidden_folder_exclude_inverse(self):
         """Test non-recursive search with inverse."""
 
@@ -311,7 +435,8 @@ class TestWcmatch(_TestWcmatch):
         for _f in walker.imatch():
             records += 1
 
-        self.assertTrue(records == 0 or walker.get_skipped() == 0)
+        self.assertEqual(records, 0)
+        self.assertEqual(walker.get_skipped(), 0)
 
     def test_empty_string_dir(self):
         """Test when directory is an empty string."""
@@ -331,6 +456,17 @@ class TestWcmatch(_TestWcmatch):
         )
         self.assertEqual(walker._root_dir, os.fsencode(target))
 
+    def test_default_checks_shared(self):
+        """Test that the default file and folder checks are shared between instances."""
+
+        w1 = wcmatch.WcMatch(self.tempdir, flags=self.default_flags)
+        w2 = wcmatch.WcMatch(self.tempdir, flags=self.default_flags)
+        w3 = wcmatch.WcMatch(self.tempdir_bytes, flags=self.default_flags)
+        self.assertIs(w1.file_check, w2.file_check)
+        self.assertIs(w1.folder_exclude_check, w2.folder_exclude_check)
+        self.assertIsNot(w1.file_check, w3.file_check)
+        self.assertTrue(w3.file_check.match(b'a.txt'))
+
     def test_empty_string_file(self):
         """Test when file pattern is an empty string."""
 
@@ -506,27 +642,32 @@ class TestWcmatch(_TestWcmatch):
 class TestWcmatchSymlink(_TestWcmatch):
     """Test symlinks."""
 
-    def mksymlink(self, original, link):
+    @classmethod
+    def mksymlink(cls, original, link):
         """Make symlink."""
 
         if not os.path.lexists(link):
             os.symlink(original, link)
 
+    @classmethod
+    def setUpClass(cls):
+        """Setup the file tree shared by the tests (no test modifies it)."""
+
+        super().setUpClass()
+        cls.mktemp('.hidden', 'a.txt')
+        cls.mktemp('.hidden', 'b.file')
+        cls.mktemp('.hidden_file')
+        cls.mktemp('a.txt')
+        cls.mktemp('b.file')
+        cls.mktemp('c.txt.bak')
+        cls.can_symlink = can_symlink()
+        if cls.can_symlink:
+            cls.mksymlink('.hidden', cls.norm('sym1'))
+            cls.mksymlink(os.path.join('.hidden', 'a.txt'), cls.norm('sym2'))
+
     def setUp(self):
         """Setup."""
 
-        self.tempdir = TESTFN + "_dir"
-        self.mktemp('.hidden', 'a.txt')
-        self.mktemp('.hidden', 'b.file')
-        self.mktemp('.hidden_file')
-        self.mktemp('a.txt')
-        self.mktemp('b.file')
-        self.mktemp('c.txt.bak')
-        self.can_symlink = can_symlink()
-        if self.can_symlink:
-            self.mksymlink('.hidden', self.norm('sym1'))
-            self.mksymlink(os.path.join('.hidden', 'a.txt'), self.norm('sym2'))
-
         self.default_flags = wcmatch.R | wcmatch.I | wcmatch.M
         self.errors = []
         self.skipped = 0
@@ -569,6 +710,49 @@ class TestWcmatchSymlink(_TestWcmatch):
         )
 
 
+class TestWcmatchDeep(_TestWcmatch):
+    """Test `WcMatch` on a deep directory tree."""
+
+    depth = 100
+
+    @classmethod
+    def setUpClass(cls):
+        """Setup the deep file tree shared by the tests."""
+
+        super().setUpClass()
+        cls.mktemp(*(['d'] * cls.depth), 'a.txt')
+
+    def setUp(self):
+        """Setup."""
+
+        self.errors = []
+        self.skipped = 0
+        self.skip_records = []
+        self.error_records = []
+        self.files = []
+
+    def test_deep_tree(self):
+        """Test that trees deeper than the recursion limit can be walked."""
+
+        # Only allow a little more recursion than we are already using, far less than the tree depth.
+        depth = 0
+        frame = sys._getframe()
+        while frame is not None:
+            depth += 1
+            frame = frame.f_back
+
+        for threads in (1, 2):
+            self.files = []
+            walker = wcmatch.WcMatch(self.tempdir, '*.txt', flags=wcmatch.RECURSIVE, threads=threads)
+            limit = sys.getrecursionlimit()
+            sys.setrecursionlimit(depth + 50)
+            try:
+                self.crawl_files(walker)
+            finally:
+                sys.setrecursionlimit(limit)
+            self.assertEqual(self.files, [self.norm(*(['d'] * self.depth), 'a.txt')])
+
+
 class TestExpansionLimit(unittest.TestCase):
     """Test expansion limits."""
 
@@ -4,6 +4,8 @@ import unittest
 import re
 import copy
 import wcmatch._wcparse as _wcparse
+import wcmatch._wcmatch as _wcmatch
+import wcmatch.glob as glob
 
 
 class TestWcparse(unittest.TestCase):
@@ -52,6 +54,98 @@ class TestWcparse(unittest.TestCase):
 
         self.assertEqual(len(_wcparse.compile(['|'.join(['a'] * 10)], _wcparse.SPLIT, 10)), 1)
 
+    def test_compile_wcregexp_cached(self):
+        """Test that compiling the same single pattern reuses the compiled object."""
+
+        _wcparse._compile_wcregexp_cached.cache_clear()
+
+        w1 = _wcparse.compile('*.txt|*.py', _wcparse.SPLIT)
+        w2 = _wcparse.compile('*.txt|*.py', _wcparse.SPLIT)
+        self.assertIs(w1, w2)
+        self.assertIsNot(w1, _wcparse.compile(b'*.txt|*.py', _wcparse.SPLIT))
+        self.assertEqual(w1, _wcparse.compile(['*.txt|*.py'], _wcparse.SPLIT))
+        self.assertIsNot(w1, _wcparse.compile(['*.txt|*.py'], _wcparse.SPLIT))
+
+    def test_compile_combined(self):
+        """Test that multiple include and exclude patterns match the same as individually."""
+
+        for pattern, flags in (
+            ('a*|b|!ax|!b', _wcparse.SPLIT | _wcparse.NEGATE),
+            (b'a*|b|!ax|!b', _wcparse.SPLIT | _wcparse.NEGATE),
+            ('a*|!*x|!*y', _wcparse.SPLIT | _wcparse.NEGATE | _wcparse.DOTMATCH),
+            ('a*|b|!ax', _wcparse.SPLIT | _wcparse.NEGATE)
+        ):
+            w = _wcparse.compile(pattern, flags)
+            self.assertIsNotNone(w._combined)
+            for name in ('a', 'ax', 'ay', 'b', 'c', 'ax\n', 'a\n'):
+                if isinstance(pattern, bytes):
+                    name = name.encode('ascii')
+                self.assertEqual(
+                    w.match(name),
+                    _wcmatch._match_pattern(name, w._include, w._exclude),
+                    name
+                )
+
+    def test_compile_suffix(self):
+        """Test that patterns which are only a literal suffix match the same as the regular expression."""
+
+        for pattern, flags in (
+            ('*.txt', 0),
+            ('*.txt|*.py', _wcparse.SPLIT),
+            ('*.txt', _wcparse.DOTMATCH),
+            (b'*.txt.bak', 0),
+            ('*.a\\+b', 0),
+            ('*.TXT', _wcparse.IGNORECASE),
+            (b'*.Txt', _wcparse.IGNORECASE),
+            ('*.sk', _wcparse.IGNORECASE)
+        ):
+            w = _wcparse.compile(pattern, flags)
+            self.assertIsNotNone(w._suffixes)
+            for name in (
+                'a.txt', '.txt', 'a.txt\n', 'a.py', 'a.txt.bak', 'txt', 'a.a+b', 'a.aab', 'A.TxT', 'a.\u017f\u212a'
+            ):
+                if isinstance(pattern, bytes):
+                    name = name.encode('utf-8')
+                self.assertEqual(
+                    w.match(name),
+                    _wcmatch._match_pattern(name, w._include, w._exclude),
+                    name
+                )
+
+        self.assertIsNone(_wcparse.compile('*.txt*', 0)._suffixes)
+        self.assertIsNone(_wcparse.compile('*.é', _wcparse.IGNORECASE)._suffixes)
+        self.assertIsNone(_wcparse.compile('*.txt', _wcparse.PATHNAME)._suffixes)
+        self.assertIsNone(_wcparse.compile('*.txt|!a.txt', _wcparse.SPLIT | _wcparse.NEGATE)._suffixes)
+
+    def test_translate_cached(self):
+        """Test that translating the same pattern reuses the parsed result."""
+
+        _wcparse._translate_cached.cache_clear()
+
+        p1 = _wcparse.translate('*.txt|!a.txt', _wcparse.SPLIT | _wcparse.NEGATE)
+        p2 = _wcparse.translate('*.txt|!a.txt', _wcparse.SPLIT | _wcparse.NEGATE)
+        self.assertEqual(p1, p2)
+        self.assertEqual(_wcparse._translate_cached.cache_info().hits, 2)
+
+    def test_translate_cached_masked(self):
+        """Test that flags which don't affect parsing share a translation."""
+
+        _wcparse._translate_cached.cache_clear()
+
+        _wcparse._translate('*.txt', _wcparse.PATHNAME)
+        _wcparse._translate('*.txt', _wcparse.PATHNAME | glob.MARK)
+        self.assertEqual(_wcparse._translate_cached.cache_info().hits, 1)
+
+    def test_compile_pattern_cached_masked(self):
+        """Test that flags which don't affect parsing share a compiled regex."""
+
+        _wcparse._compile_pattern_cached.cache_clear()
+
+        p1 = _wcparse._compile('*.txt', _wcparse.PATHNAME)
+        p2 = _wcparse._compile('*.txt', _wcparse.PATHNAME | glob.MARK)
+        self.assertIs(p1, p2)
+        self.assertEqual(_wcparse._compile_pattern_cached.cache_info().hits, 1)
+
     def test_translate_expansion_okay(self):
         """Test expansion is okay."""
 
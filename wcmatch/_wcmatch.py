@@ -4,6 +4,7 @@ import re
 import os
 import stat
 import copyreg
+import functools
 from . import util
 from typing import Pattern, AnyStr, Generic, Any, cast
 
@@ -21,6 +22,135 @@ RE_MOUNT = (
     re.compile(r'/'),
     re.compile(br'/')
 )
+# Translated patterns that are just a literal suffix: `*.txt` with and without `DOTMATCH` or `IGNORECASE`
+RE_SUFFIX = (
+    re.compile(r'\^\(\?s(i)?:\(\?=\.\)(\(\?!\[\.\]\))?\.\*\?((?:[\w-]|\\\W)+)\)\$'),
+    re.compile(br'\^\(\?s(i)?:\(\?=\.\)(\(\?!\[\.\]\))?\.\*\?((?:[\w-]|\\\W)+)\)\$')
+)
+RE_UNESCAPE = (
+    re.compile(r'\\(.)', re.DOTALL),
+    re.compile(br'\\(.)', re.DOTALL)
+)
+
+
+def _match_pattern(
+    filename: AnyStr,
+    include: tuple[Pattern[AnyStr], ...],
+    exclude: tuple[Pattern[AnyStr], ...] | None
+) -> bool:
+    """Match filename against the include and exclude patterns."""
+
+    matched = False
+    for pattern in include:
+        if pattern.fullmatch(filename):
+            matched = True
+            break
+
+    if matched and exclude:
+        for pattern in exclude:
+            if pattern.fullmatch(filename):
+                matched = False
+                break
+    return matched
+
+
+@functools.lru_cache(maxsize=256)
+def _suffix_patterns(
+    include: tuple[Pattern[AnyStr], ...],
+    exclude: tuple[Pattern[AnyStr], ...] | None
+) -> tuple[tuple[AnyStr, AnyStr | None, bool, Pattern[AnyStr]], ...] | None:
+    """
+    Get the literal suffixes of include patterns that only match a file extension (`*.txt`).
+
+    Each suffix is returned with the prefix of names that must be rejected (`.` if dot files can't
+    be matched), whether the compare is case insensitive (the suffix is then lowercased), and the
+    original pattern. If any pattern can't be matched with a simple suffix compare, `None` is returned.
+    """
+
+    if not include or exclude:
+        return None
+
+    ptype = util.BYTES if isinstance(include[0].pattern, bytes) else util.UNICODE
+    dot = cast(AnyStr, b'.' if ptype == util.BYTES else '.')
+    re_suffix = cast(Pattern[AnyStr], RE_SUFFIX[ptype])
+    re_unescape = cast(Pattern[AnyStr], RE_UNESCAPE[ptype])
+
+    suffixes = []  # type: list[tuple[AnyStr, AnyStr | None, bool, Pattern[AnyStr]]]
+    for pattern in include:
+        m = re_suffix.fullmatch(pattern.pattern)
+        if m is None:
+            return None
+        suffix = re_unescape.sub(lambda e: e.group(1), m.group(3))
+        ignorecase = bool(m.group(1))
+        if ignorecase:
+            # Only ASCII is safe to fold with `lower()`, Unicode case folding in `re` differs.
+            if not suffix.isascii():
+                return None
+            suffix = suffix.lower()
+        suffixes.append((suffix, dot if m.group(2) else None, ignorecase, pattern))
+    return tuple(suffixes)
+
+
+def _match_suffix(filename: AnyStr, suffixes: tuple[tuple[AnyStr, AnyStr | None, bool, Pattern[AnyStr]], ...]) -> bool:
+    """Match filename against literal suffixes."""
+
+    if not isinstance(filename, type(suffixes[0][0])):
+        # Let the regular expression raise the same error for mixed string types as it would otherwise.
+        return suffixes[0][3].fullmatch(filename) is not None
+
+    for suffix, reject, ignorecase, pattern in suffixes:
+        if not ignorecase:
+            matched = filename.endswith(suffix)
+        else:
+            tail = filename[-len(suffix):]
+            if not tail.isascii():
+                # Some non-ASCII characters fold to ASCII, let the regular expression decide.
+                if pattern.fullmatch(filename):
+                    return True
+                continue
+            matched = tail.lower() == suffix
+        if matched and not (reject is not None and filename.startswith(reject)):
+            return True
+    return False
+
+
+@functools.lru_cache(maxsize=256)
+def _combine_patterns(
+    include: tuple[Pattern[AnyStr], ...],
+    exclude: tuple[Pattern[AnyStr], ...] | None
+) -> tuple[Pattern[AnyStr], Pattern[AnyStr] | None] | None:
+    """
+    Combine the include patterns, and the exclude patterns, each into a single pattern.
+
+    The combined patterns give the same result as `_match_pattern` with at most two `fullmatch` calls:
+    the includes are matched first, and the excludes are only checked once an include has matched.
+
+    If there is nothing to combine, or the patterns can't be combined (compiled with different
+    flags), `None` is returned.
+    """
+
+    if not include or (len(include) < 2 and (not exclude or len(exclude) < 2)):
+        return None
+
+    flags = include[0].flags
+    if any(p.flags != flags for p in include + (exclude if exclude else ())):
+        return None
+
+    combined = []  # type: list[Pattern[AnyStr]]
+    for patterns in (include, exclude) if exclude else (include,):
+        if len(patterns) == 1:
+            combined.append(patterns[0])
+            continue
+        if isinstance(include[0].pattern, bytes):
+            pattern = b'(?:' + b')|(?:'.join(cast('list[bytes]', [p.pattern for p in patterns])) + b')'
+        else:
+            pattern = '(?:' + ')|(?:'.join(cast('list[str]', [p.pattern for p in patterns])) + ')'
+        try:
+            combined.append(cast(Pattern[AnyStr], re.compile(pattern, flags)))
+        except re.error:  # pragma: no cover
+            return None
+
+    return combined[0], combined[1] if exclude else None
 
 
 class _Match(Generic[AnyStr]):
@@ -213,20 +343,7 @@ class _Match(Generic[AnyStr]):
             else:
                 return False
 
-        matched = False
-        for pattern in self.include:
-            if pattern.fullmatch(self.filename):
-                matched = True
-                break
-
-        if matched:
-            matched = True
-            if self.exclude:
-                for pattern in self.exclude:
-                    if pattern.fullmatch(self.filename):
-                        matched = False
-                        break
-        return matched
+        return _match_pattern(self.filename, self.include, self.exclude)
 
 
 class WcRegexp(util.Immutable, Generic[AnyStr]):
@@ -238,8 +355,10 @@ class WcRegexp(util.Immutable, Generic[AnyStr]):
     _path: bool
     _follow: bool
     _hash: int
+    _combined: tuple[Pattern[AnyStr], Pattern[AnyStr] | None] | None
+    _suffixes: tuple[tuple[AnyStr, AnyStr | None, bool, Pattern[AnyStr]], ...] | None
 
-    __slots__ = ("_include", "_exclude", "_real", "_path", "_follow", "_hash")
+    __slots__ = ("_include", "_exclude", "_real", "_path", "_follow", "_hash", "_combined", "_suffixes")
 
     def __init__(
         self,
@@ -266,7 +385,9 @@ class WcRegexp(util.Immutable, Generic[AnyStr]):
                     type(path), path,
                     type(follow), follow
                 )
-            )
+            ),
+            _combined=_combine_patterns(include, exclude) if not real else None,
+            _suffixes=_suffix_patterns(include, exclude) if not real else None
         )
 
     def __hash__(self) -> int:
@@ -282,8 +403,10 @@ class WcRegexp(util.Immutable, Generic[AnyStr]):
     def __eq__(self, other: Any) -> bool:
         """Equal."""
 
+        # Compare the precomputed hashes first so unequal objects are rejected cheaply.
         return (
             isinstance(other, WcRegexp) and
+            self._hash == other._hash and
             self._include == other._include and
             self._exclude == other._exclude and
             self._real == other._real and
@@ -292,20 +415,25 @@ class WcRegexp(util.Immutable, Generic[AnyStr]):
         )
 
     def __ne__(self, other: Any) -> bool:
-        """Equal."""
+        """Not equal."""
 
-        return (
-            not isinstance(other, WcRegexp) or
-            self._include != other._include or
-            self._exclude != other._exclude or
-            self._real != other._real or
-            self._path != other._path or
-            self._follow != other._follow
-        )
+        return not self.__eq__(other)
 
     def match(self, filename: AnyStr, root_dir: AnyStr | None = None, dir_fd: int | None = None) -> bool:
         """Match filename."""
 
+        # Matching that doesn't involve the file system can skip the `_Match` setup.
+        if not self._real:
+            if self._suffixes is not None:
+                return _match_suffix(filename, self._suffixes)
+            if self._combined is not None:
+                # Excludes are only checked once an include has matched.
+                include, exclude = self._combined
+                if include.fullmatch(filename) is None:
+                    return False
+                return exclude is None or exclude.fullmatch(filename) is None
+            return _match_pattern(filename, self._include, self._exclude)
+
         return _Match(
             filename,
             self._include,
@@ -6,8 +6,9 @@ import bracex
 import os
 from . import util
 from . import posix
+from . import _wcmatch
 from . _wcmatch import WcRegexp
-from typing import AnyStr, Iterable, Pattern, Generic, Sequence, overload, cast
+from typing import Any, AnyStr, Iterable, Pattern, Generic, Sequence, overload, cast
 
 UNICODE_RANGE = '\u0000-\U0010ffff'
 ASCII_RANGE = '\x00-\xff'
@@ -54,6 +55,11 @@ RE_MAGIC_ESCAPE = (
     re.compile(r'([-!~*?()\[\]|{}]|(?<!\\)(?:(?:[\\]{2})*)\\(?!\\))'),
     re.compile(br'([-!~*?()\[\]|{}]|(?<!\\)(?:(?:[\\]{2})*)\\(?!\\))')
 )
+# Characters that `RE_MAGIC_ESCAPE` may need to escape
+MAGIC_ESCAPE = (
+    frozenset('-!~*?()[]|{}\\'),
+    frozenset(b'-!~*?()[]|{}\\')
+)
 
 MAGIC_DEF = (
     frozenset("*?[]\\"),
@@ -117,6 +123,22 @@ TILDE_SYM = (
 RE_ANCHOR = re.compile(r'^/+')
 RE_WIN_ANCHOR = re.compile(r'^(?:\\\\|/)+')
 RE_POSIX = re.compile(r':(alnum|alpha|ascii|blank|cntrl|digit|graph|lower|print|punct|space|upper|word|xdigit):\]')
+# Runs of literal characters when parsing a pattern: without and with `EXTMATCH`
+RE_LITERAL = (
+    re.compile(r'[^.*?/\\\[]+'),
+    re.compile(r'[^.*?/\\\[+@!]+')
+)
+# Runs of literal characters inside an extended pattern list
+RE_EXT_LITERAL = re.compile(r'[^.*?/\\\[+@!|)]+')
+# Runs of consecutive path separators
+RE_SLASHES = re.compile(r'/+')
+# Runs of characters that need no special handling inside a character sequence
+RE_SEQUENCE_LITERAL = re.compile(r'[^\-\[\\/\]&~|]+')
+# Runs of characters that have no special meaning when splitting on `|`: without and with `EXTMATCH`
+RE_SPLIT_LITERAL = (
+    re.compile(r'[^|\\\[]+'),
+    re.compile(r'[^|\\\[*?+@!]+')
+)
 
 SET_OPERATORS = frozenset(('&', '~', '|'))
 NEGATIVE_SYM = frozenset((b'!', '!'))
@@ -265,6 +287,38 @@ _NO_WIN_DIR = (
 )
 
 
+def _format_path_pieces(bare_sep: str) -> dict[str, str]:
+    """Format the path pieces that depend on the path separator."""
+
+    sep = {"sep": bare_sep}
+    path_sep = '[{}]'.format(bare_sep)
+    return {
+        'bare_sep': bare_sep,
+        'sep': path_sep,
+        'path_eop': _PATH_EOP.format(**sep),
+        'no_dir': _NO_DIR.format(**sep),
+        'seq_path': _PATH_NO_SLASH.format(**sep),
+        'seq_path_dot': _PATH_NO_SLASH_DOT.format(**sep),
+        'path_star': _PATH_STAR.format(**sep),
+        'path_star_dot1': _PATH_STAR_DOTMATCH.format(**sep),
+        'path_star_dot2': _PATH_STAR_NO_DOTMATCH.format(**sep),
+        'path_gstar_dot1': _PATH_GSTAR_DOTMATCH.format(**sep),
+        'path_gstar_dot2': _PATH_GSTAR_NO_DOTMATCH.format(**sep),
+        'need_char_path': _NEED_CHAR_PATH.format(**sep),
+        'globstar_div': _GLOBSTAR_DIV.format(path_sep),
+        'need_sep': _NEED_SEP.format(path_sep),
+        'seps': path_sep + _ONE_OR_MORE,
+        'path_trail': _PATH_TRAIL.format(path_sep)
+    }
+
+
+# Path pieces are only ever formatted for Unix or Windows separators, so format them once (keyed by `unix`)
+_PATH_PIECES = {
+    True: _format_path_pieces(re.escape('/')),
+    False: _format_path_pieces(re.escape('\\/'))
+}
+
+
 class InvPlaceholder(str):
     """Placeholder for inverse pattern !(...)."""
 
@@ -313,6 +367,7 @@ def escape(pattern: AnyStr, unix: bool | None = None, pathname: bool = True, raw
     if isinstance(pattern, bytes):
         drive_pat = cast(Pattern[AnyStr], RE_WIN_DRIVE[util.BYTES])
         magic = cast(Pattern[AnyStr], RE_MAGIC_ESCAPE[util.BYTES])
+        magic_chars = MAGIC_ESCAPE[util.BYTES]  # type: frozenset[str | int]
         drive_magic = cast(Pattern[AnyStr], RE_WIN_DRIVE_MAGIC[util.BYTES])
         replace = br'\\\1'
         slash = b'\\'
@@ -321,6 +376,7 @@ def escape(pattern: AnyStr, unix: bool | None = None, pathname: bool = True, raw
     else:
         drive_pat = cast(Pattern[AnyStr], RE_WIN_DRIVE[util.UNICODE])
         magic = cast(Pattern[AnyStr], RE_MAGIC_ESCAPE[util.UNICODE])
+        magic_chars = MAGIC_ESCAPE[util.UNICODE]
         drive_magic = cast(Pattern[AnyStr], RE_WIN_DRIVE_MAGIC[util.UNICODE])
         replace = r'\\\1'
         slash = '\\'
@@ -344,6 +400,9 @@ def escape(pattern: AnyStr, unix: bool | None = None, pathname: bool = True, raw
             drive = drive_magic.sub(replace, m.group(0))
     pattern = pattern[length:]
 
+    # Most names have nothing to escape, so only run the substitution when needed.
+    if magic_chars.isdisjoint(pattern):
+        return drive + pattern
     return drive + magic.sub(replace, pattern)
 
 
@@ -398,40 +457,46 @@ def _get_win_drive(
     return root_specified, drive, slash, end
 
 
-def _get_magic_symbols(pattern: AnyStr, unix: bool, flags: int) -> tuple[set[AnyStr], set[AnyStr]]:
+def _get_magic_symbols(pattern: AnyStr, unix: bool, flags: int) -> tuple[frozenset[AnyStr], frozenset[AnyStr]]:
     """Get magic symbols."""
 
-    if isinstance(pattern, bytes):
-        ptype = util.BYTES
-        slash = b'\\'  # type: AnyStr
-    else:
-        ptype = util.UNICODE
-        slash = '\\'
+    return cast(
+        'tuple[frozenset[AnyStr], frozenset[AnyStr]]',
+        _magic_symbols(
+            util.BYTES if isinstance(pattern, bytes) else util.UNICODE,
+            unix,
+            flags & (BRACE | SPLIT | GLOBTILDE | EXTMATCH | NEGATE | MINUSNEGATE)
+        )
+    )
+
 
-    magic = set()  # type: set[AnyStr]
+@functools.lru_cache(maxsize=256)
+def _magic_symbols(ptype: int, unix: bool, flags: int) -> tuple[frozenset[Any], frozenset[Any]]:
+    """Build the magic symbols for the given pattern type, path style, and flags."""
+
+    magic = set(MAGIC_DEF[ptype])  # type: set[Any]
     if unix:
-        magic_drive = set()  # type: set[AnyStr]
+        magic_drive = set()  # type: set[Any]
     else:
-        magic_drive = {slash}
+        magic_drive = {b'\\' if ptype == util.BYTES else '\\'}
 
-    magic |= cast('set[AnyStr]', MAGIC_DEF[ptype])
     if flags & BRACE:
-        magic |= cast('set[AnyStr]', MAGIC_BRACE[ptype])
-        magic_drive |= cast('set[AnyStr]', MAGIC_BRACE[ptype])
+        magic |= MAGIC_BRACE[ptype]
+        magic_drive |= MAGIC_BRACE[ptype]
     if flags & SPLIT:
-        magic |= cast('set[AnyStr]', MAGIC_SPLIT[ptype])
-        magic_drive |= cast('set[AnyStr]', MAGIC_SPLIT[ptype])
+        magic |= MAGIC_SPLIT[ptype]
+        magic_drive |= MAGIC_SPLIT[ptype]
     if flags & GLOBTILDE:
-        magic |= cast('set[AnyStr]', MAGIC_TILDE[ptype])
+        magic |= MAGIC_TILDE[ptype]
     if flags & EXTMATCH:
-        magic |= cast('set[AnyStr]', MAGIC_EXTMATCH[ptype])
+        magic |= MAGIC_EXTMATCH[ptype]
     if flags & NEGATE:
         if flags & MINUSNEGATE:
-            magic |= cast('set[AnyStr]', MAGIC_MINUS_NEGATE[ptype])
+            magic |= MAGIC_MINUS_NEGATE[ptype]
         else:
-            magic |= cast('set[AnyStr]', MAGIC_NEGATE[ptype])
+            magic |= MAGIC_NEGATE[ptype]
 
-    return magic, magic_drive
+    return frozenset(magic), frozenset(magic_drive)
 
 
 def is_magic(pattern: AnyStr, flags: int = 0) -> bool:
@@ -462,11 +527,9 @@ def is_magic(pattern: AnyStr, flags: int = 0) -> bool:
                     break
 
     if not magical:
-        pattern = pattern[length:]
-        for c in magic:
-            if c in pattern:
-                magical = True
-                break
+        # Magic symbols are all single characters (integers for bytes),
+        # so we can scan the pattern in one pass.
+        magical = not magic.isdisjoint(pattern[length:])
 
     return magical
 
@@ -502,6 +565,10 @@ def expand_braces(patterns: AnyStr, flags: int, limit: int) -> Iterable[AnyStr]:
 
     if flags & BRACE:
         for p in ([patterns] if isinstance(patterns, (str, bytes)) else patterns):
+            # Without an opening brace there is nothing to expand (`bracex` yields nothing for an empty pattern).
+            if p and (b'{' if isinstance(p, bytes) else '{') not in p:
+                yield p
+                continue
             try:
                 # Turn off limit as we are handling it ourselves.
                 yield from bracex.iexpand(p, keep_escapes=True, limit=limit)
@@ -554,6 +621,7 @@ def is_case_sensitive(flags: int) -> bool:
     return case_sensitive
 
 
+@functools.lru_cache(maxsize=256)
 def get_case(flags: int) -> bool:
     """Parse flags for case sensitivity settings."""
 
@@ -572,6 +640,7 @@ def escape_drive(drive: str, case: bool) -> str:
     return '(?i:{})'.format(re.escape(drive)) if case else re.escape(drive)
 
 
+@functools.lru_cache(maxsize=256)
 def is_unix_style(flags: int) -> bool:
     """Check if we should use Unix style."""
 
@@ -648,9 +717,9 @@ def translate(
                 if expanded not in seen:
                     seen.add(expanded)
                     if is_negative(expanded, flags):
-                        negative.append(WcParse(expanded[1:], flags | _NO_GLOBSTAR_CAPTURE | DOTMATCH).parse())
+                        negative.append(_translate(expanded[1:], flags | _NO_GLOBSTAR_CAPTURE | DOTMATCH))
                     else:
-                        positive.append(WcParse(expanded, flags).parse())
+                        positive.append(_translate(expanded, flags))
             if limit:
                 current_limit -= count
                 if current_limit < 1:
@@ -661,9 +730,7 @@ def translate(
     if negative and not positive:
         if flags & NEGATEALL:
             default = b'**' if isinstance(negative[0], bytes) else '**'
-            positive.append(
-                WcParse(default, flags | (GLOBSTAR if flags & PATHNAME else 0)).parse()
-            )
+            positive.append(_translate(default, flags | (GLOBSTAR if flags & PATHNAME else 0)))
 
     if positive and flags & NODIR:
         index = util.BYTES if isinstance(positive[0], bytes) else util.UNICODE
@@ -784,6 +851,38 @@ def compile(  # noqa: A001
 ) -> WcRegexp[AnyStr]:
     """Compile patterns."""
 
+    # Single patterns can be cached as a whole, but not if we need to expand the user directory
+    # as the expansion is dependent on the file system.
+    if (
+        isinstance(patterns, (str, bytes)) and
+        (exclude is None or isinstance(exclude, (str, bytes))) and
+        not (flags & GLOBTILDE and flags & REALPATH)
+    ):
+        return _compile_wcregexp_cached(patterns, flags, limit, exclude)
+
+    return _compile_wcregexp(patterns, flags, limit, exclude)
+
+
+@functools.lru_cache(maxsize=256, typed=True)
+def _compile_wcregexp_cached(
+    patterns: AnyStr,
+    flags: int,
+    limit: int,
+    exclude: AnyStr | None
+) -> WcRegexp[AnyStr]:
+    """Compile and cache a single pattern into a `WcRegexp` object."""
+
+    return _compile_wcregexp(patterns, flags, limit, exclude)
+
+
+def _compile_wcregexp(
+    patterns: AnyStr | Sequence[AnyStr],
+    flags: int,
+    limit: int,
+    exclude: AnyStr | Sequence[AnyStr] | None
+) -> WcRegexp[AnyStr]:
+    """Compile patterns into a `WcRegexp` object."""
+
     positive, negative = compile_pattern(patterns, flags, limit, exclude)
     return WcRegexp(
         tuple(positive), tuple(negative),
@@ -791,11 +890,48 @@ def compile(  # noqa: A001
     )
 
 
+def _translate(pattern: AnyStr, flags: int) -> AnyStr:
+    """Translate the pattern to regex."""
+
+    # Mask before hitting the cache so flags that don't affect parsing share an entry.
+    return cast(AnyStr, _translate_cached(pattern, flags & FLAG_MASK))
+
+
 @functools.lru_cache(maxsize=256, typed=True)
+def _translate_cached(pattern: AnyStr, flags: int) -> AnyStr:
+    """Translate and cache the pattern to regex."""
+
+    return WcParse(pattern, flags).parse()
+
+
 def _compile(pattern: AnyStr, flags: int) -> Pattern[AnyStr]:
     """Compile the pattern to regex."""
 
-    return re.compile(WcParse(pattern, flags & FLAG_MASK).parse())
+    # Mask before hitting the cache so flags that don't affect parsing share an entry.
+    return _compile_pattern_cached(pattern, flags & FLAG_MASK)
+
+
+@functools.lru_cache(maxsize=256, typed=True)
+def _compile_pattern_cached(pattern: AnyStr, flags: int) -> Pattern[AnyStr]:
+    """Compile and cache the pattern to regex."""
+
+    return re.compile(WcParse(pattern, flags).parse())
+
+
+def _clear_caches() -> None:
+    """Clear all the pattern caches, along with the cached case sensitivity checks they depend on."""
+
+    for cached in (
+        get_case,
+        is_unix_style,
+        _magic_symbols,
+        _compile_wcregexp_cached,
+        _translate_cached,
+        _compile_pattern_cached,
+        _wcmatch._suffix_patterns,
+        _wcmatch._combine_patterns
+    ):
+        cached.cache_clear()
 
 
 class WcSplit(Generic[AnyStr]):
@@ -883,20 +1019,27 @@ class WcSplit(Generic[AnyStr]):
 
         return success
 
-    def _split(self, pattern: str) -> Iterable[str]:
-        """Split the pattern."""
+    def _split(self, pattern: str) -> Iterable[tuple[int, int]]:
+        """Split the pattern, returning the start and end index of each part."""
 
         start = -1
         i = util.StringIter(pattern)
+        re_literal = RE_SPLIT_LITERAL[self.extend]
+
+        while True:
+            # Skip ahead to the next character that may need handling
+            i.match(re_literal)
+            try:
+                c = next(i)
+            except StopIteration:
+                break
 
-        for c in i:
             if self.extend and c in EXT_TYPES and self.parse_extend(c, i):
                 continue
 
             if c == '|':
                 split = i.index - 1
-                p = pattern[start + 1:split]
-                yield p
+                yield start + 1, split
                 start = split
             elif c == '\\':
                 index = i.index
@@ -912,16 +1055,17 @@ class WcSplit(Generic[AnyStr]):
                     i.rewind(i.index - index)
 
         if start < len(pattern):
-            yield pattern[start + 1:]
+            yield start + 1, len(pattern)
 
     def split(self) -> Iterable[AnyStr]:
         """Split the pattern."""
 
-        if isinstance(self.pattern, bytes):
-            for p in self._split(self.pattern.decode('latin-1')):
-                yield p.encode('latin-1')
-        else:
-            yield from self._split(self.pattern)
+        # Bytes are parsed as Latin-1 so character indexes are the same as byte indexes,
+        # which allows parts to be sliced directly from the original pattern.
+        source = self.pattern
+        pattern = source.decode('latin-1') if isinstance(source, bytes) else source
+        for start, end in self._split(pattern):
+            yield source[start:end]
 
 
 class WcParse(Generic[AnyStr]):
@@ -959,25 +1103,28 @@ class WcParse(Generic[AnyStr]):
             self.win_drive_detect = self.pathname
             self.char_avoid = (ord('\\'), ord('/'), ord('.'))  # type: tuple[int, ...]
             self.bslash_abort = self.pathname
-            sep = {"sep": re.escape('\\/')}
         else:
             self.win_drive_detect = False
             self.char_avoid = (ord('/'), ord('.'))
             self.bslash_abort = False
-            sep = {"sep": re.escape('/')}
-        self.bare_sep = sep['sep']
-        self.sep = '[{}]'.format(self.bare_sep)
-        self.path_eop = _PATH_EOP.format(**sep)
-        self.no_dir = _NO_DIR.format(**sep)
-        self.seq_path = _PATH_NO_SLASH.format(**sep)
-        self.seq_path_dot = _PATH_NO_SLASH_DOT.format(**sep)
-        self.path_star = _PATH_STAR.format(**sep)
-        self.path_star_dot1 = _PATH_STAR_DOTMATCH.format(**sep)
-        self.path_star_dot2 = _PATH_STAR_NO_DOTMATCH.format(**sep)
-        self.path_gstar_dot1 = _PATH_GSTAR_DOTMATCH.format(**sep)
-        self.path_gstar_dot2 = _PATH_GSTAR_NO_DOTMATCH.format(**sep)
+        pieces = _PATH_PIECES[self.unix]
+        self.bare_sep = pieces['bare_sep']
+        self.sep = pieces['sep']
+        self.path_eop = pieces['path_eop']
+        self.no_dir = pieces['no_dir']
+        self.seq_path = pieces['seq_path']
+        self.seq_path_dot = pieces['seq_path_dot']
+        self.path_star = pieces['path_star']
+        self.path_star_dot1 = pieces['path_star_dot1']
+        self.path_star_dot2 = pieces['path_star_dot2']
+        self.path_gstar_dot1 = pieces['path_gstar_dot1']
+        self.path_gstar_dot2 = pieces['path_gstar_dot2']
+        self.globstar_div = pieces['globstar_div']
+        self.need_sep = pieces['need_sep']
+        self.seps = pieces['seps']
+        self.path_trail = pieces['path_trail']
         if self.pathname:
-            self.need_char = _NEED_CHAR_PATH.format(**sep)
+            self.need_char = pieces['need_char_path']
         else:
             self.need_char = _NEED_CHAR
 
@@ -1068,7 +1215,10 @@ class WcParse(Generic[AnyStr]):
             # is the end of a range.
             if end_range and i.index - 1 >= end_range:
                 result[-1] = '\\' + result[-1]
-            result.append(posix.get_posix_property(m.group(1), self.is_bytes))
+            # `RE_POSIX` only matches known classes, so look the property up directly.
+            result.append(
+                (posix.ascii_posix_properties if self.is_bytes else posix.unicode_posix_properties)[m.group(1)]
+            )
         return last_posix
 
     def _sequence(self, i: util.StringIter) -> str:
@@ -1150,6 +1300,13 @@ class WcParse(Generic[AnyStr]):
             else:
                 result.append(value)
 
+            # Characters that need no special handling can be consumed in bulk,
+            # but each must remain a separate entry as it may start a range.
+            if not end_range:
+                m = i.match(RE_SEQUENCE_LITERAL)
+                if m:
+                    result.extend(m.group(0))
+
             c = next(i)
 
         result.append(']')
@@ -1185,7 +1342,7 @@ class WcParse(Generic[AnyStr]):
             value = r'\\'
             if self.bslash_abort:
                 if not self.in_list:
-                    value = self.sep + _ONE_OR_MORE
+                    value = self.seps
                     self.set_start_dir()
                 else:
                     value = self._restrict_extended_slash() + self.sep
@@ -1197,7 +1354,7 @@ class WcParse(Generic[AnyStr]):
                 raise PathNameException
             if self.pathname:
                 if not self.in_list:
-                    value = self.sep + _ONE_OR_MORE
+                    value = self.seps
                     self.set_start_dir()
                 else:
                     value = self._restrict_extended_slash() + self.sep
@@ -1341,7 +1498,7 @@ class WcParse(Generic[AnyStr]):
 
         self.reset_dir_track()
         if value == globstar:
-            sep = _GLOBSTAR_DIV.format(self.sep)
+            sep = self.globstar_div
             # Check if the last entry was a `globstar`
             # If so, don't bother adding another.
             if current[-1] != sep:
@@ -1350,7 +1507,7 @@ class WcParse(Generic[AnyStr]):
                     current[-1] = value
                 else:
                     # Replace the last path separator
-                    current[-1] = _NEED_SEP.format(self.sep)
+                    current[-1] = self.need_sep
                     current.append(value)
                 self.consume_path_sep(i)
                 current.append(sep)
@@ -1376,17 +1533,20 @@ class WcParse(Generic[AnyStr]):
         if not self.inv_ext:
             return
 
-        index = len(current) - 1
-        while index >= 0:
+        # Walk backwards, growing the text that follows each placeholder as we go
+        # so that every entry is only joined once.
+        eop = '' if nested else (_EOP if not self.pathname else self.path_eop)
+        tail = ''
+        end = len(current)
+        for index in range(end - 1, -1, -1):
             if isinstance(current[index], InvPlaceholder):
-                content = current[index + 1:]
-                if not nested:
-                    content.append(_EOP if not self.pathname else self.path_eop)
+                tail = ''.join(current[index + 1:end]) + tail
+                end = index + 1
+                content = tail + eop
                 current[index] = (
-                    (''.join(content).replace('(?#)', '?:') if self.capture else ''.join(content)) +
+                    (content.replace('(?#)', '?:') if self.capture else content) +
                     (_EXCLA_GROUP_CLOSE.format(str(current[index])))
                 )
-            index -= 1
         self.inv_ext = 0
 
     def parse_extend(self, c: str, i: util.StringIter, current: list[str], reset_dot: bool = False) -> bool:
@@ -1456,9 +1616,15 @@ class WcParse(Generic[AnyStr]):
                         i.rewind(i.index - subindex)
                         extended.append(r'\[')
                 elif c != ')':
+                    m = i.match(RE_EXT_LITERAL)
+                    if m:
+                        self.update_dir_state()
+                        c += m.group(0)
                     extended.append(re.escape(c))
 
-                self.update_dir_state()
+                # Once settled, the directory state won't change until a handler resets it.
+                if self.dir_start or self.after_start:
+                    self.update_dir_state()
 
             if list_type == '?':
                 current.append((_QMARK_CAPTURE_GROUP if self.capture else _QMARK_GROUP).format(''.join(extended)))
@@ -1531,10 +1697,7 @@ class WcParse(Generic[AnyStr]):
                 if count > 0 and count % 2:
                     i.rewind(1)
             else:
-                c = '/'
-                while c == '/':
-                    c = next(i)
-                i.rewind(1)
+                i.match(RE_SLASHES)
         except StopIteration:
             pass
 
@@ -1550,7 +1713,7 @@ class WcParse(Generic[AnyStr]):
             if drive is not None:
                 current.append(drive)
                 if slash:
-                    current.append(self.sep + _ONE_OR_MORE)
+                    current.append(self.seps)
                 i.advance(end)
                 self.consume_path_sep(i)
             elif drive is None and root_specified:
@@ -1570,6 +1733,7 @@ class WcParse(Generic[AnyStr]):
             current.append(_NO_WIN_ROOT if self.win_drive_detect else _NO_ROOT)
             current.append('')
 
+        re_literal = RE_LITERAL[self.extend]
         for c in i:
 
             index = i.index
@@ -1586,7 +1750,7 @@ class WcParse(Generic[AnyStr]):
                 if self.pathname:
                     self.set_start_dir()
                     self.clean_up_inverse(current)
-                    current.append(self.sep + _ONE_OR_MORE)
+                    current.append(self.seps)
                     self.consume_path_sep(i)
                     self.matchbase = False
                 else:
@@ -1613,14 +1777,22 @@ class WcParse(Generic[AnyStr]):
                     i.rewind(i.index - index)
                     current.append(re.escape(c))
             else:
+                # Escape any literal characters that follow along with this one. Every character
+                # advances the directory state, but it settles after two characters.
+                m = i.match(re_literal)
+                if m:
+                    self.update_dir_state()
+                    c += m.group(0)
                 current.append(re.escape(c))
 
-            self.update_dir_state()
+            # Once settled, the directory state won't change until a handler resets it.
+            if self.dir_start or self.after_start:
+                self.update_dir_state()
 
         self.clean_up_inverse(current)
 
         if self.pathname:
-            current.append(_PATH_TRAIL.format(self.sep))
+            current.append(self.path_trail)
 
     def _parse(self, p: str) -> str:
         """Parse pattern."""
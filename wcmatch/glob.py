@@ -8,7 +8,7 @@ import os
 import sys
 import re
 import functools
-from collections import namedtuple
+import operator
 import bracex
 from . import _wcparse
 from . import _wcmatch
@@ -99,6 +99,13 @@ _RE_WIN_PATHLIB_DOT_NORM = (
 )  # type: tuple[Pattern[str], Pattern[bytes]]
 
 
+# Runs of characters that have no special meaning when splitting on path parts: without and with `EXTMATCH`
+_RE_SPLIT_LITERAL = (
+    re.compile(r'[^/\\\[]+'),
+    re.compile(r'[^/\\\[*?+@!]+')
+)
+
+
 def _flag_transform(flags: int) -> int:
     """Transform flags to glob defaults."""
 
@@ -120,11 +127,34 @@ def _flag_transform(flags: int) -> int:
     return flags
 
 
-class _GlobPart(
-    namedtuple('_GlobPart', ['pattern', 'is_magic', 'is_globstar', 'dir_only', 'is_drive']),
-):
+class _GlobPart(Generic[AnyStr]):
     """File Glob."""
 
+    __slots__ = ('dir_only', 'is_drive', 'is_globstar', 'is_magic', 'pattern')
+
+    def __init__(
+        self,
+        pattern: AnyStr | Pattern[AnyStr],
+        is_magic: bool,
+        is_globstar: bool,
+        dir_only: bool,
+        is_drive: bool
+    ) -> None:
+        """Initialize."""
+
+        self.pattern = pattern  # type: AnyStr | Pattern[AnyStr]
+        self.is_magic = is_magic
+        self.is_globstar = is_globstar
+        self.dir_only = dir_only
+        self.is_drive = is_drive
+
+    def __repr__(self) -> str:
+        """Representation."""
+
+        return '{}({!r}, {!r}, {!r}, {!r}, {!r})'.format(
+            type(self).__name__, self.pattern, self.is_magic, self.is_globstar, self.dir_only, self.is_drive
+        )
+
 
 class _GlobSplit(Generic[AnyStr]):
     """
@@ -184,15 +214,12 @@ class _GlobSplit(Generic[AnyStr]):
             self.sep = '/'
         # Once split, Windows file names will never have `\\` in them,
         # so we can use the Unix magic detect
-        self.magic_symbols = _wcparse._get_magic_symbols(pattern, self.unix, self.flags)[0]  # type: set[AnyStr]
+        self.magic_symbols = _wcparse._get_magic_symbols(pattern, self.unix, self.flags)[0]  # type: frozenset[AnyStr]
 
     def is_magic(self, name: AnyStr) -> bool:
         """Check if name contains magic characters."""
 
-        for c in self.magic_symbols:
-            if c in name:
-                return True
-        return False
+        return not self.magic_symbols.isdisjoint(name)
 
     def _sequence(self, i: util.StringIter) -> None:
         """Handle character group."""
@@ -271,7 +298,7 @@ class _GlobSplit(Generic[AnyStr]):
 
         return success
 
-    def store(self, value: AnyStr, l: list[_GlobPart], dir_only: bool) -> None:
+    def store(self, value: AnyStr, l: list[_GlobPart[AnyStr]], dir_only: bool) -> None:
         """Group patterns by literals and potential magic patterns."""
 
         if l and value in (b'', ''):
@@ -288,19 +315,22 @@ class _GlobSplit(Generic[AnyStr]):
         else:
             l.append(_GlobPart(v, magic, globstar, dir_only, False))
 
-    def split(self) -> list[_GlobPart]:
+    def split(self) -> list[_GlobPart[AnyStr]]:
         """Start parsing the pattern."""
 
         split_index = []
-        parts = []
+        parts = []  # type: list[_GlobPart[AnyStr]]
         start = -1
 
-        if isinstance(self.pattern, bytes):
+        # Bytes are parsed as Latin-1 so character indexes are the same as byte indexes,
+        # which allows parts to be sliced directly from the original pattern.
+        source = self.pattern
+        if isinstance(source, bytes):
             is_bytes = True
-            pattern = self.pattern.decode('latin-1')
+            pattern = source.decode('latin-1')
         else:
             is_bytes = False
-            pattern = self.pattern
+            pattern = source
 
         i = util.StringIter(pattern)
 
@@ -308,11 +338,12 @@ class _GlobSplit(Generic[AnyStr]):
         if self.win_drive_detect:
             root_specified, drive, slash, end = _wcparse._get_win_drive(pattern)
             if drive is not None:
-                parts.append(_GlobPart(drive.encode('latin-1') if is_bytes else drive, False, False, True, True))
+                drive_part = cast(AnyStr, drive.encode('latin-1') if is_bytes else drive)
+                parts.append(_GlobPart(drive_part, False, False, True, True))
                 start = end - 1
                 i.advance(start)
             elif drive is None and root_specified:
-                parts.append(_GlobPart(b'\\' if is_bytes else '\\', False, False, True, True))
+                parts.append(_GlobPart(cast(AnyStr, b'\\' if is_bytes else '\\'), False, False, True, True))
                 if pattern.startswith('/'):
                     start = 0
                     i.advance(1)
@@ -320,11 +351,19 @@ class _GlobSplit(Generic[AnyStr]):
                     start = 1
                     i.advance(2)
         elif not self.win_drive_detect and pattern.startswith('/'):
-            parts.append(_GlobPart(b'/' if is_bytes else '/', False, False, True, True))
+            parts.append(_GlobPart(cast(AnyStr, b'/' if is_bytes else '/'), False, False, True, True))
             start = 0
             i.advance(1)
 
-        for c in i:
+        re_literal = _RE_SPLIT_LITERAL[self.extend]
+        while True:
+            # Skip ahead to the next character that may need handling
+            i.match(re_literal)
+            try:
+                c = next(i)
+            except StopIteration:
+                break
+
             if self.extend and c in _wcparse.EXT_TYPES and self.parse_extend(c, i):
                 continue
 
@@ -347,24 +386,23 @@ class _GlobSplit(Generic[AnyStr]):
                     i.rewind(i.index - index)
 
         for split, offset in split_index:
-            value = pattern[start + 1:split]
-            self.store(cast(AnyStr, value.encode('latin-1') if is_bytes else value), parts, True)
+            self.store(source[start + 1:split], parts, True)
             start = split + offset
 
         if start < len(pattern):
-            value = pattern[start + 1:]
-            if value:
-                self.store(cast(AnyStr, value.encode('latin-1') if is_bytes else value), parts, False)
+            part = source[start + 1:]
+            if part:
+                self.store(part, parts, False)
 
         if len(pattern) == 0:
-            parts.append(_GlobPart(pattern.encode('latin-1') if is_bytes else pattern, False, False, False, False))
+            parts.append(_GlobPart(source, False, False, False, False))
 
         if (
             (self.extmatchbase and not parts[0].is_drive) or
             (self.matchbase and len(parts) == 1 and not parts[0].dir_only)
         ):
             self.globstar = True
-            parts.insert(0, _GlobPart(b'**' if is_bytes else '**', True, True, True, False))
+            parts.insert(0, _GlobPart(cast(AnyStr, b'**' if is_bytes else '**'), True, True, True, False))
 
         if self.no_abs and parts and parts[0].is_drive:
             raise ValueError('The pattern must be a relative path pattern')
@@ -392,7 +430,7 @@ class Glob(Generic[AnyStr]):
         if epats is not None:
             flags = _wcparse.no_negate_flags(flags)
 
-        self.pattern = []  # type: list[list[_GlobPart]]
+        self.pattern = []  # type: list[list[_GlobPart[AnyStr]]]
         self.npatterns = []  # type: list[Pattern[AnyStr]]
         self.seen = set()  # type: set[AnyStr]
         self.dir_fd = dir_fd if SUPPORT_DIR_FD else None  # type: int | None
@@ -565,10 +603,10 @@ class Glob(Generic[AnyStr]):
 
         return bool(self.npatterns and self._match_excluded(path, is_dir))
 
-    def _match_literal(self, a: AnyStr, b: AnyStr | None = None) -> bool:
-        """Match two names."""
+    def _match_literal(self, a: AnyStr, b: AnyStr) -> bool:
+        """Match a name against an already lowercased name, ignoring case."""
 
-        return a.lower() == b if not self.case_sensitive else a == b
+        return a.lower() == b
 
     def _get_matcher(self, target: AnyStr | Pattern[AnyStr] | None) -> Callable[..., Any] | None:
         """Get deep match."""
@@ -578,10 +616,9 @@ class Glob(Generic[AnyStr]):
         elif isinstance(target, (str, bytes)):
             # Plain text match
             if not self.case_sensitive:
-                match = target.lower()
+                matcher = functools.partial(self._match_literal, b=target.lower())
             else:
-                match = target
-            matcher = functools.partial(self._match_literal, b=match)
+                matcher = functools.partial(operator.eq, target)
         else:
             # File match pattern
             matcher = target.match
@@ -673,7 +710,12 @@ class Glob(Generic[AnyStr]):
             if deep and not hidden and is_dir and follow:
                 yield from self._glob_dir(path, matcher, dir_only, deep)
 
-    def _glob(self, curdir: AnyStr, part: _GlobPart, rest: list[_GlobPart]) -> Iterator[tuple[AnyStr, bool]]:
+    def _glob(
+        self,
+        curdir: AnyStr,
+        part: _GlobPart[AnyStr],
+        rest: list[_GlobPart[AnyStr]]
+    ) -> Iterator[tuple[AnyStr, bool]]:
         """
         Handle glob flow.
 
@@ -689,7 +731,7 @@ class Glob(Generic[AnyStr]):
 
         is_magic = part.is_magic
         dir_only = part.dir_only
-        target = part.pattern
+        target = part.pattern  # type: AnyStr | Pattern[AnyStr] | None
         is_globstar = part.is_globstar
 
         if is_magic and is_globstar:
@@ -809,7 +851,7 @@ class Glob(Generic[AnyStr]):
                     # Path starts with normal plain text
                     # Lets verify the case of the starting directory (if possible)
                     this = pattern[0]
-                    curdir = this[0]
+                    curdir = cast(AnyStr, this.pattern)
 
                     # Abort if we cannot find the drive, or if current directory is empty
                     if not curdir or (self.is_abs_pattern and not self._lexists(self.prepend_base(curdir))):
@@ -133,6 +133,8 @@ def norm_pattern(pattern: AnyStr, normalize: bool | None, is_raw_chars: bool, ig
 class StringIter:
     """Preprocess replace tokens."""
 
+    __slots__ = ('_index', '_string')
+
     def __init__(self, string: str) -> None:
         """Initialize."""
 
@@ -145,9 +147,18 @@ class StringIter:
         return self
 
     def __next__(self) -> str:
-        """Python 3 iterator compatible next."""
+        """Iterate through characters of the string."""
 
-        return self.iternext()
+        try:
+            char = self._string[self._index]
+            self._index += 1
+        except IndexError as e:
+            raise StopIteration from e
+
+        return char
+
+    # Older name for `__next__`, kept for compatibility.
+    iternext = __next__
 
     def match(self, pattern: Pattern[str]) -> Match[str] | None:
         """Perform regex match at index."""
@@ -181,17 +192,6 @@ class StringIter:
 
         self._index -= count
 
-    def iternext(self) -> str:
-        """Iterate through characters of the string."""
-
-        try:
-            char = self._string[self._index]
-            self._index += 1
-        except IndexError as e:  # pragma: no cover
-            raise StopIteration from e
-
-        return char
-
 
 class Immutable:
     """Immutable."""
@@ -210,22 +210,30 @@ class Immutable:
         raise AttributeError('Class is immutable!')
 
 
-def is_hidden(path: AnyStr) -> bool:
-    """Check if file is hidden."""
+def is_hidden(path: AnyStr | os.DirEntry[AnyStr]) -> bool:
+    """
+    Check if file is hidden.
+
+    A `DirEntry` from `os.scandir` can be given in place of a path, in which
+    case the entry's cached stat info is used (on Windows, this requires no system call).
+    """
 
     hidden = False
-    f = os.path.basename(path)
+    if isinstance(path, os.DirEntry):
+        f = path.name
+    else:
+        f = os.path.basename(path)
     if f[:1] in ('.', b'.'):
         # Count dot file as hidden on all systems
         hidden = True
     elif sys.platform == 'win32':
         # On Windows, look for `FILE_ATTRIBUTE_HIDDEN`
-        results = os.lstat(path)
+        results = path.stat(follow_symlinks=False) if isinstance(path, os.DirEntry) else os.lstat(path)
         FILE_ATTRIBUTE_HIDDEN = 0x2
         hidden = bool(results.st_file_attributes & FILE_ATTRIBUTE_HIDDEN)
     elif sys.platform == "darwin":  # pragma: no cover
         # On macOS, look for `UF_HIDDEN`
-        results = os.lstat(path)
+        results = path.stat(follow_symlinks=False) if isinstance(path, os.DirEntry) else os.lstat(path)
         hidden = bool(results.st_flags & stat.UF_HIDDEN)
     return hidden
 
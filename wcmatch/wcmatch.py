@@ -6,6 +6,8 @@ A module for performing wild card matches.
 from __future__ import annotations
 import os
 import re
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from . import _wcparse
 from . import _wcmatch
 from . import util
@@ -64,6 +66,16 @@ FLAG_MASK = (
     MATCHBASE
 )
 
+# Matchers used when no file or folder exclude pattern is given. They are immutable, so all instances can share them.
+_MATCH_ALL = (
+    _wcmatch.WcRegexp((re.compile(r'^.*$', re.DOTALL),)),
+    _wcmatch.WcRegexp((re.compile(br'^.*$', re.DOTALL),))
+)  # type: tuple[_wcmatch.WcRegexp[str], _wcmatch.WcRegexp[bytes]]
+_MATCH_NONE = _wcmatch.WcRegexp(())  # type: _wcmatch.WcRegexp[Any]
+
+# Folder reads taking at least this long (in seconds) are considered slow enough to read ahead.
+_SLOW_READ = 0.001
+
 
 class WcMatch(Generic[AnyStr]):
     """Finds files by wildcard."""
@@ -75,6 +87,7 @@ class WcMatch(Generic[AnyStr]):
         exclude_pattern: AnyStr | None = None,
         flags: int = 0,
         limit: int = _wcparse.PATHNAME,
+        threads: int = 1,
         **kwargs: Any
     ):
         """Initialize the directory walker object."""
@@ -87,6 +100,7 @@ class WcMatch(Generic[AnyStr]):
         self._sep = os.fsencode(os.sep) if isinstance(root_dir, bytes) else os.sep  # type: AnyStr
         self._root_dir = self._add_sep(self._get_cwd(), True)  # type: AnyStr
         self.limit = limit
+        self.threads = max(threads, 1)
         empty = os.fsencode('') if isinstance(root_dir, bytes) else ''
         self.pattern_file = file_pattern if file_pattern is not None else empty  # type: AnyStr
         self.pattern_folder_exclude = exclude_pattern if exclude_pattern is not None else empty  # type: AnyStr
@@ -144,33 +158,32 @@ class WcMatch(Generic[AnyStr]):
             if self.matchbase:
                 flags |= MATCHBASE
 
-        return _wcparse.compile([pattern], flags, self.limit) if pattern else None
+        return _wcparse.compile(pattern, flags, self.limit) if pattern else None
 
     def _compile(self, file_pattern: AnyStr, folder_exclude_pattern: AnyStr) -> None:
         """Compile patterns."""
 
         if self.file_check is None:
             if not file_pattern:
-                self.file_check = _wcmatch.WcRegexp(
-                    (re.compile(br'^.*$' if isinstance(file_pattern, bytes) else r'^.*$', re.DOTALL),)
-                )
+                self.file_check = _MATCH_ALL[1] if isinstance(file_pattern, bytes) else _MATCH_ALL[0]
             else:
                 self.file_check = self._compile_wildcard(file_pattern, self.file_pathname)
 
         if self.folder_exclude_check is None:
             if not folder_exclude_pattern:
-                self.folder_exclude_check = _wcmatch.WcRegexp(())
+                self.folder_exclude_check = _MATCH_NONE
             else:
                 self.folder_exclude_check = self._compile_wildcard(folder_exclude_pattern, self.dir_pathname)
 
-    def _valid_file(self, base: AnyStr, name: AnyStr) -> bool:
+    def _valid_file(self, base: AnyStr, name: AnyStr, entry: os.DirEntry[AnyStr] | None = None) -> bool:
         """Return whether a file can be searched."""
 
         valid = False
-        fullpath = os.path.join(base, name)
-        if self.file_check is not None and self.compare_file(fullpath[self._base_len:] if self.file_pathname else name):
+        if self.file_check is not None and self.compare_file(
+            os.path.join(base, name)[self._base_len:] if self.file_pathname else name
+        ):
             valid = True
-        if valid and (not self.show_hidden and util.is_hidden(fullpath)):
+        if valid and not self.show_hidden and util.is_hidden(entry if entry is not None else os.path.join(base, name)):
             valid = False
         return self.on_validate_file(base, name) if valid else valid
 
@@ -184,20 +197,19 @@ class WcMatch(Generic[AnyStr]):
 
         return True
 
-    def _valid_folder(self, base: AnyStr, name: AnyStr) -> bool:
+    def _valid_folder(self, base: AnyStr, name: AnyStr, entry: os.DirEntry[AnyStr] | None = None) -> bool:
         """Return whether a folder can be searched."""
 
         valid = True
-        fullpath = os.path.join(base, name)
         if (
             not self.recursive or
             (
                 self.folder_exclude_check and
-                not self.compare_directory(fullpath[self._base_len:] if self.dir_pathname else name)
+                not self.compare_directory(os.path.join(base, name)[self._base_len:] if self.dir_pathname else name)
             )
         ):
             valid = False
-        if valid and (not self.show_hidden and util.is_hidden(fullpath)):
+        if valid and not self.show_hidden and util.is_hidden(entry if entry is not None else os.path.join(base, name)):
             valid = False
         return self.on_validate_directory(base, name) if valid else valid
 
@@ -254,52 +266,168 @@ class WcMatch(Generic[AnyStr]):
 
         self._abort = False
 
+    def _scandir(
+        self,
+        path: AnyStr
+    ) -> tuple[list[AnyStr], list[AnyStr], set[AnyStr], dict[AnyStr, os.DirEntry[AnyStr]]] | None:
+        """
+        Read a directory.
+
+        Returns the folder names, the file names, the folder names that are symlinks,
+        and the `DirEntry` of each entry (only kept if hidden files are not shown).
+        If the directory cannot be read, `None` is returned.
+
+        The entries are kept so that hidden checks, which are only done once a name is accepted,
+        can use the entry's cached stat info (free on Windows) instead of looking it up again by path.
+        """
+
+        dirs = []  # type: list[AnyStr]
+        files = []  # type: list[AnyStr]
+        links = set()  # type: set[AnyStr]
+        entries = {}  # type: dict[AnyStr, os.DirEntry[AnyStr]]
+        try:
+            with os.scandir(path) as scan:
+                for entry in scan:
+                    if not self.show_hidden:
+                        entries[entry.name] = entry
+
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:  # pragma: no cover
+                        is_dir = False
+
+                    if is_dir:
+                        dirs.append(entry.name)
+                        try:
+                            if entry.is_symlink():
+                                links.add(entry.name)
+                        except OSError:  # pragma: no cover
+                            pass
+                    else:
+                        files.append(entry.name)
+        except OSError:  # pragma: no cover
+            return None
+        return dirs, files, links, entries
+
+    def _walk_tree(
+        self,
+        pool: ThreadPoolExecutor | None
+    ) -> Iterator[tuple[AnyStr, list[AnyStr], list[AnyStr], dict[AnyStr, os.DirEntry[AnyStr]]]]:
+        """
+        Walk the directory tree top down.
+
+        Like `os.walk`, folders removed from the yielded folder list are not walked,
+        and an explicit stack is used so that deep trees are not limited by recursion.
+        When a thread pool is provided, the next few folders to be walked are read ahead
+        in the pool while the current folder is being processed.
+        """
+
+        stack = [self._root_dir]
+        pending: dict[AnyStr, Future[Any]] = {}
+        queued: list[Future[Any]] = []
+        ahead = self.threads * 4
+        slow = False
+
+        try:
+            while stack:
+                if self.is_aborted():
+                    break
+
+                base = stack.pop()
+                future = pending.pop(base, None)
+                if future is None or future.cancel():
+                    # Not read ahead, or the pool hasn't got to it yet, so just read it here.
+                    # Reading ahead only pays off when reads block, so note whether this one did.
+                    start = time.perf_counter()
+                    listing = self._scandir(base)
+                    slow = time.perf_counter() - start >= _SLOW_READ
+                else:
+                    listing = future.result()
+                if listing is None:  # pragma: no cover
+                    continue
+
+                dirs, files, links, entries = listing
+                yield base, dirs, files, entries
+
+                # Push in reverse so folders are popped in the order they were listed.
+                stack.extend(
+                    os.path.join(base, name) for name in reversed(dirs) if self.follow_links or name not in links
+                )
+
+                if pool is not None and slow:
+                    # Top up reads for the folders that will be walked next. Reads that are already
+                    # queued are left alone, even if we went deeper, as we will get to them eventually,
+                    # but only reads that are still in progress count towards the limit.
+                    queued = [f for f in queued if not f.done()]
+                    index = len(stack)
+                    end = max(index - ahead, 0)
+                    while len(queued) < ahead and index > end:
+                        index -= 1
+                        path = stack[index]
+                        if path not in pending:
+                            pending[path] = pool.submit(self._scandir, path)
+                            queued.append(pending[path])
+        finally:
+            # Don't bother reading folders we will never get to.
+            for future in pending.values():
+                future.cancel()
+
     def _walk(self) -> Iterator[Any]:
         """Start search for valid files."""
 
         self._base_len = len(self._root_dir)
+        # Only a recursive search walks more than one folder, so only then is there anything to read ahead.
+        pool = ThreadPoolExecutor(max_workers=self.threads) if self.threads > 1 and self.recursive else None
 
-        for base, dirs, files in os.walk(self._root_dir, followlinks=self.follow_links):
-            if self.is_aborted():
-                break
-
-            # Remove child folders based on exclude rules
-            for name in dirs[:]:
-                try:
-                    if not self._valid_folder(base, name):
-                        dirs.remove(name)
-                except Exception:
-                    dirs.remove(name)
-                    value = self.on_error(base, name)
-                    if value is not None:  # pragma: no cover
-                        yield value
-
-                if self.is_aborted():  # pragma: no cover
+        try:
+            for base, dirs, files, entries in self._walk_tree(pool):
+                if self.is_aborted():
                     break
 
-            # Search files if they were found
-            if files:
-                # Only search files that are in the include rules
-                for name in files:
+                # Without recursion, no folders will be searched, so don't bother validating them.
+                if not self.recursive:
+                    dirs.clear()
+
+                # Remove child folders based on exclude rules
+                for name in dirs[:]:
                     try:
-                        valid = self._valid_file(base, name)
+                        if not self._valid_folder(base, name, entries.get(name)):
+                            dirs.remove(name)
                     except Exception:
-                        valid = False
+                        dirs.remove(name)
                         value = self.on_error(base, name)
-                        if value is not None:
+                        if value is not None:  # pragma: no cover
                             yield value
 
-                    if valid:
-                        yield self.on_match(base, name)
-                    else:
-                        self._skipped += 1
-                        value = self.on_skip(base, name)
-                        if value is not None:
-                            yield value
-
-                    if self.is_aborted():
+                    if self.is_aborted():  # pragma: no cover
                         break
 
+                # Search files if they were found
+                if files:
+                    # Only search files that are in the include rules
+                    for name in files:
+                        try:
+                            valid = self._valid_file(base, name, entries.get(name))
+                        except Exception:
+                            valid = False
+                            value = self.on_error(base, name)
+                            if value is not None:
+                                yield value
+
+                        if valid:
+                            yield self.on_match(base, name)
+                        else:
+                            self._skipped += 1
+                            value = self.on_skip(base, name)
+                            if value is not None:
+                                yield value
+
+                        if self.is_aborted():
+                            break
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=False)
+
     def match(self) -> list[Any]:
         """Run the directory walker."""
 
@@ -310,5 +438,9 @@ class WcMatch(Generic[AnyStr]):
 
         self.on_reset()
         self._skipped = 0
-        for f in self._walk():
-            yield f
+
+        # Killed before we started, don't bother reading the root folder.
+        if self.is_aborted():
+            return
+
+        yield from self._walk()